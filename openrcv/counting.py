@@ -5,6 +5,7 @@ Support for counting ballots.
 """
 
 import logging
+from operator import itemgetter
 import os
 import string
 
@@ -25,14 +26,6 @@ from openrcv.utils import FileInfo, ENCODING_INTERNAL_BALLOTS
 log = logging.getLogger(__name__)
 
 
-def any_value(dict_):
-    """Return any value in dict."""
-    try:
-        return next(iter(dict_.values()))
-    except StopIteration:
-        raise ValueError("dict has no values")
-
-
 def normalized_ballots(lines):
     """
     Return an iterator object of normalized internal ballots.
@@ -43,7 +36,9 @@ def normalized_ballots(lines):
     The iterator returns each internal ballot as a (weight, choices) 2-tuple.
 
     Arguments:
-      lines: an iterable of lines in an internal ballot file.
+      lines: an iterable of lines in an internal ballot file (for
+        example, an open file object).  The lines are consumed one at
+        a time, so they need not all be in memory at once.
 
     """
     # A dict mapping tuples of choices to the cumulative weight.
@@ -51,20 +46,12 @@ def normalized_ballots(lines):
 
     for line in lines:
         weight, choices = parse_internal_ballot(line)
-        try:
-            choices_dict[choices] += weight
-        except KeyError:
-            # Then we are adding the choices for the first time.
-            choices_dict[choices] = weight
+        choices_dict[choices] = choices_dict.get(choices, 0) + weight
 
-    sorted_choices = sorted(choices_dict.keys())
+    # Sort once by choices (and not by weight).
+    sorted_items = sorted(choices_dict.items(), key=itemgetter(0))
 
-    def iterator():
-        for choices in sorted_choices:
-            weight = choices_dict[choices]
-            yield weight, choices
-
-    return iterator()
+    return ((weight, choices) for choices, weight in sorted_items)
 
 
 def count_internal_ballots(ballot_stream, candidates):
@@ -98,30 +85,31 @@ def get_winner(totals):
       totals: dict of candidate to vote total.
 
     """
-    total = sum(totals.values())
-    threshold = get_majority(total)
-    for candidate, candidate_total in totals.items():
-        if candidate_total >= threshold:
-            return candidate
-    return None
+    if not totals:
+        return None
+    threshold = get_majority(sum(totals.values()))
+    # At most one candidate can have a majority, so it suffices to
+    # check the candidate with the highest total.
+    candidate, candidate_total = max(totals.items(), key=itemgetter(1))
+    return candidate if candidate_total >= threshold else None
 
 
 def get_lowest(totals):
     """
-    Return which candidate to eliminate.
+    Return the set of candidates with the lowest total.
 
-    Raises a NotImplementedError if there is a tie.
+    The set contains more than one candidate if there is a tie for
+    last place.  Raises a ValueError if totals is empty.
+
+    Arguments:
+      totals: dict of candidate to vote total.
 
     """
-    lowest_total = any_value(totals)
-    lowest_candidates = set()
-    for candidate, total in totals.items():
-        if total < lowest_total:
-            lowest_total = total
-            lowest_candidates = set((candidate,))
-        elif total == lowest_total:
-            lowest_candidates.add(candidate)
-    return lowest_candidates
+    if not totals:
+        raise ValueError("totals has no values")
+    lowest_total = min(totals.values())
+    return set((candidate for candidate, total in totals.items()
+                if total == lowest_total))
 
 
 def count_irv_contest(ballot_stream, candidates):
@@ -211,10 +199,11 @@ class InternalBallotsNormalizer(Parser):
     def parse_lines(self, lines):
         normalized = normalized_ballots(lines)
 
+        text = "".join((make_internal_ballot_line(weight, choices, "\n")
+                        for weight, choices in normalized))
+
         with self.output_stream.open("w") as f:
-            for weight, choices in normalized:
-                line = make_internal_ballot_line(weight, choices, "\n")
-                f.write(line)
+            f.write(text)
 
 
 # TODO: this class should take the "count" function as an argument.
@@ -39,6 +39,8 @@ class JsonBallot(JsonableMixin):
 
     """
 
+    __slots__ = ('choices', 'weight')
+
     @staticmethod
     def to_ballot_stream(ballots):
         """
@@ -63,6 +65,8 @@ class JsonBallot(JsonableMixin):
         # TODO: would it help to create a general method to iterate through
         # internal ballots in a ballot stream?  Also, if we do this, we
         # could use a Parser, which would provide more error info.
+        # We deliberately do not cache ballots by line: JsonBallot objects
+        # are mutable, and sharing them between lines would alias them.
         ballots = []
         with ballot_stream.open() as f:
             for line in f:
@@ -98,7 +102,10 @@ class JsonBallot(JsonableMixin):
             # Can happen with "1 2 abc", for example.
             # ValueError: invalid literal for int() with base 10: 'abc'
             raise JsonObjError("error parsing: %r" % jsobj)
-        self.__init__(choices=choices, weight=weight)
+        # parse_internal_ballot() already returns a tuple of choices, so
+        # there is no need to go through __init__().
+        self.choices = choices
+        self.weight = weight
 
     def to_jsobj(self):
         """Return the ballot as a JSON object."""
@@ -117,6 +124,8 @@ class JsonContest(JsonableMixin):
 
     """
 
+    __slots__ = ('ballots', 'candidate_count', 'id', 'notes')
+
     meta_attrs = (Attribute('id'),
                   Attribute('notes'))
     data_attrs = (Attribute('ballots', cls=JsonBallot),
@@ -185,6 +194,9 @@ class JsonRoundResults(RoundResults, JsonableMixin):
 
     """
 
+    # The totals slot is defined by RoundResults.
+    __slots__ = ()
+
     data_attrs = (Attribute('totals'), )
     attrs = data_attrs
 
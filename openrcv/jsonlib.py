@@ -134,15 +134,34 @@ class Attribute(object):
 
 class JsonableMixin(ReprMixin):
 
+    __slots__ = ()
+
     __no_attribute__ = object()  # used in __eq__()
 
     meta_attrs = ()
 
+    @classmethod
+    def get_attr_names(cls):
+        """
+        Return a frozenset of the names of the class's attrs.
+
+        The return value is computed once per class and then cached on it.
+
+        """
+        # We check the class's own __dict__ so that a subclass does not
+        # pick up the cached value of its parent class.
+        try:
+            return cls.__dict__['_attr_names']
+        except KeyError:
+            pass
+        names = frozenset((attr.name for attr in cls.attrs))
+        cls._attr_names = names
+        return names
+
     def __eq__(self, other):
         if type(self) != type(other):
             return False
-        for attr in self.attrs:
-            name = attr.name
+        for name in self.get_attr_names():
             if (getattr(self, name, self.__no_attribute__) !=
                 getattr(other, name, other.__no_attribute__)):
                 return False
@@ -224,7 +243,7 @@ class JsonableMixin(ReprMixin):
             self._attrs_from_jsdict(self.meta_attrs, meta_dict)
         keys |= set(jsobj.keys())
         keys -= set(('_meta', ))
-        extra_keys = set((attr.name for attr in self.attrs)) - keys
+        extra_keys = self.get_attr_names() - keys
         if extra_keys:
             log.warning("JSON object has unserializable keys: %r" % (", ".join(extra_keys)))
         self._attrs_from_jsdict(self.data_attrs, jsobj)
@@ -51,6 +51,8 @@ class RoundResults(object):
 
     """
 
+    __slots__ = ('totals', )
+
     def __init__(self, totals):
         """
         Arguments:
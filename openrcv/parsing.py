@@ -1,4 +1,5 @@
 
+from itertools import chain
 import logging
 import os
 
@@ -28,14 +29,14 @@ def make_internal_ballot_line(weight, choices, final=''):
     Return the internal ballot representation of the ballot.
 
     Arguments:
-      choices: an iterable of choices.
+      choices: an iterable of choices, or None for no choices.
 
     """
-    choices = "" if not choices else " ".join((str(c) for c in choices))
-    # Only include the space separator if choices are present.
-    # Also, note that there is no terminal 0 like in the BLT format.
-    ballot = "%s%s%s%s" % (weight, " " if choices else "", choices, final)
-    return ballot
+    # Joining the weight together with the choices means the space
+    # separator is only included if choices are present.  Also, note
+    # that there is no terminal 0 like in the BLT format.
+    values = chain((weight, ), choices or ())
+    return " ".join(map(str, values)) + final
 
 
 def parse_internal_ballot(line):
@@ -43,7 +44,8 @@ def parse_internal_ballot(line):
     Parse an internal ballot line (with or without a trailing newline).
 
     This function allows leading and trailing spaces.  ValueError is
-    raised if one of the values does not parse to an integer.
+    raised if the line is empty or if one of the values does not parse
+    to an integer.
 
     An internal ballot line is a space-delimited string of integers of the
     form--
@@ -51,10 +53,10 @@ def parse_internal_ballot(line):
     "WEIGHT CHOICE1 CHOICE2 CHOICE3 ...".
 
     """
-    ints = parse_integer_line(line)
-    weight = next(ints)
-    choices = tuple(ints)
-    return weight, choices
+    values = line.split()
+    if not values:
+        raise ValueError("internal ballot line has no weight: %r" % line)
+    return int(values[0]), tuple(map(int, values[1:]))
 
 
 # TODO: add the line number, etc. as attributes.
@@ -1,11 +1,9 @@
 
 import argparse
-from contextlib import contextmanager
 import logging
 import os
 import sys
 from textwrap import dedent
-from traceback import format_exc
 
 import colorlog
 
@@ -20,43 +18,61 @@ EXIT_STATUS_USAGE_ERROR = 2
 PROG_NAME = os.path.basename(sys.argv[0])
 
 log = logging.getLogger(PROG_NAME)
+# The root logger never changes, so we look it up only once.
+_ROOT_LOGGER = logging.getLogger()
+
+# A dict mapping log level to a log handler for sys.stderr.  These
+# handlers are reused across log_config() calls so they only need to be
+# built once.  We only cache handlers for sys.stderr (the default) so
+# that the cache stays bounded and does not keep other file objects alive.
+_STDERR_HANDLERS = {}
 
 
 class DisplayNameFilter(object):
 
     """A logging filter that sets display_name."""
 
-    def filter(self, record):
-        record.display_name = record.name
-        return True
-
+    def __init__(self, truncate=False):
+        """
+        Arguments:
+          truncate: whether to shorten long logger names.
 
-class TruncatedDisplayNameFilter(object):
-
-    """A logging filter that sets a truncated display_name."""
+        """
+        self.truncate = truncate
+        # A dict mapping logger name to display name.
+        self._cache = {}
 
     def filter(self, record):
-        parts = record.name.split(".")
-        if len(parts) <= 3:
-            display_name = record.name
-        else:
-            # For example, "a.b.c.d" becomes "a.b...d".
-            display_name = '.'.join(parts[:2] + ['.', parts[-1]])
+        name = record.name
+        display_name = self._cache.get(name)
+        if display_name is None:
+            if not self.truncate or name.count(".") <= 2:
+                display_name = name
+            else:
+                # For example, "a.b.c.d" becomes "a.b...d".
+                first, second, rest = name.split(".", 2)
+                last = rest.rsplit(".", 1)[1]
+                display_name = "%s.%s...%s" % (first, second, last)
+            self._cache[name] = display_name
         record.display_name = display_name
         return True
 
 
 def get_filter(level):
-    if level <= logging.DEBUG:
-        cls = DisplayNameFilter
-    else:
-        cls = TruncatedDisplayNameFilter
-    return cls()
+    return DisplayNameFilter(truncate=(level > logging.DEBUG))
+
+
+# Prefix log messages unobtrusively with "log" to distinguish log
+# messages more obviously from other text sent to the error stream.
+LOG_FORMAT = "log: %(display_name)s: [%(levelname)s] %(message)s"
+
+
+def make_plain_formatter():
+    """Return a formatter for streams that do not support color."""
+    return logging.Formatter(LOG_FORMAT)
 
 
 def make_formatter():
-    # Prefix log messages unobtrusively with "log" to distinguish log
-    # messages more obviously from other text sent to the error stream.
     format_string = ("%(bg_black)s%(log_color)slog: %(display_name)s: "
                      "[%(levelname)s]%(reset)s %(message)s")
     colors = colorlog.default_log_colors
@@ -65,10 +81,31 @@ def make_formatter():
     return formatter
 
 def make_log_handler(level, file_=None):
+    """
+    Return a log handler, reusing a previously created one if possible.
+
+    """
     if file_ is None:
         file_ = sys.stderr
+    if file_ is not sys.stderr:
+        return _make_log_handler(level, file_)
+
+    handler = _STDERR_HANDLERS.get(level)
+    # Check the stream in case sys.stderr was replaced (e.g. by a test).
+    if handler is not None and handler.stream is file_:
+        if handler in _ROOT_LOGGER.handlers:
+            # Then log_config() is being nested.  Return a separate
+            # handler so that exiting the inner block does not remove
+            # the handler of the outer block.
+            return _make_log_handler(level, file_)
+        return handler
+
+    handler = _make_log_handler(level, file_)
+    _STDERR_HANDLERS[level] = handler
+    return handler
+
 
-    # If file_ is None, StreamHandler uses sys.stderr.
+def _make_log_handler(level, file_):
     handler = logging.StreamHandler(file_)
     # TODO: can we delete this code comment?  Is there any reason
     # to set this handler to a level different from the root logger?
@@ -77,17 +114,54 @@ def make_log_handler(level, file_=None):
     filter_ = get_filter(level)
     handler.addFilter(filter_)
 
-    formatter = make_formatter()
+    # Color escape codes are only useful when writing to a terminal.
+    isatty = getattr(file_, "isatty", None)
+    if isatty is not None and isatty():
+        formatter = make_formatter()
+    else:
+        formatter = make_plain_formatter()
     handler.setFormatter(formatter)
 
     return handler
 
 
-@contextmanager
-def log_config(level, file_=None):
+class _LogConfig(object):
+
     """
     A context manager to configure logging and then undo the configuration.
 
+    See log_config() for more info.
+
+    """
+
+    def __init__(self, level, file_=None):
+        self.level = level
+        self.file_ = file_
+
+    def __enter__(self):
+        level = self.level
+        root = _ROOT_LOGGER
+        # If logging was already configured (e.g. at the outset of a test run),
+        # then let's not change the root logging level.
+        # TODO: simplify this logic (e.g. we should not need "if" logic).
+        already_configured = root.hasHandlers()
+        handler = make_log_handler(level, file_=self.file_)
+        root.addHandler(handler)
+        if not already_configured:
+            root.setLevel(level)
+            log.debug("root logger level set to: %r" % logging.getLevelName(level))
+        log.debug("a logging handler was added")
+        self.handler = handler
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _ROOT_LOGGER.removeHandler(self.handler)
+
+
+def log_config(level, file_=None):
+    """
+    Return a context manager to configure logging and then undo the
+    configuration.
+
     Undoing the configuration is useful for testing, since otherwise
     many log handlers might accumulate during the course of testing,
     due to successive calls to this method.
@@ -100,19 +174,7 @@ def log_config(level, file_=None):
     """
     if level is None:
         level = LOG_LEVEL_DEFAULT
-    root = logging.getLogger()
-    # If logging was already configured (e.g. at the outset of a test run),
-    # then let's not change the root logging level.
-    # TODO: simplify this logic (e.g. we should not need "if" logic).
-    already_configured = root.hasHandlers()
-    handler = make_log_handler(level, file_=file_)
-    root.addHandler(handler)
-    if not already_configured:
-        root.setLevel(level)
-        log.debug("root logger level set to: %r" % logging.getLevelName(level))
-    log.debug("a logging handler was added")
-    yield
-    root.removeHandler(handler)
+    return _LogConfig(level, file_=file_)
 
 
 def print_usage_error(parser, msg, file_=None):
@@ -161,9 +223,11 @@ def main_status(parser, argv, stdout=None, log_file=None):
             assert len(err_args) == 1
             print_usage_error(parser, err_args[0], file_=log_file)
             status = EXIT_STATUS_USAGE_ERROR
-        except Exception as err:
+        except Exception:
             # Log the full exception info for "unexpected" exceptions.
-            log.error(format_exc())
+            # Passing exc_info defers formatting the traceback until a
+            # handler actually emits the record.
+            log.error("unexpected exception", exc_info=True)
             status = EXIT_STATUS_FAIL
 
     return status
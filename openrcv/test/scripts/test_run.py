@@ -1,11 +1,19 @@
 
 from argparse import ArgumentParser
+import io
+import logging
 import os
+from unittest.mock import patch
 
-from openrcv.scripts.rcv import create_argparser
-from openrcv.scripts.run import main_status
+from openrcv.scripts.rcv import create_argparser, RcvArgumentParser
+from openrcv.scripts.run import (log_config, main_status, make_log_handler,
+                                 DisplayNameFilter)
 from openrcv.utiltest.helpers import UnitCase
 
+# The module-global cache of sys.stderr log handlers, for patching.
+HANDLER_CACHE_NAME = "openrcv.scripts.run._STDERR_HANDLERS"
+
+
 class MainTestCase(UnitCase):
 
     # TODO: add a test for good args.
@@ -16,3 +24,81 @@ class MainTestCase(UnitCase):
             raise Exception("foo")
         with open(os.devnull, "w") as f:
             self.assertEqual(main_status(parser, [], log_file=f), 2)
+
+    def test_main_status__unexpected_exception(self):
+        """Check that unexpected exceptions are logged with exception info."""
+        def do_func(args):
+            raise Exception("foo")
+        parser = RcvArgumentParser(prog="rcv", add_help=False)
+        parser.set_defaults(log_level=logging.INFO, run_command=do_func)
+        with open(os.devnull, "w") as f:
+            with self.assertLogs(level="ERROR") as cm:
+                self.assertEqual(main_status(parser, ["rcv"], log_file=f), 1)
+        record, = cm.records
+        self.assertEqual(record.getMessage(), "unexpected exception")
+        self.assertEqual(str(record.exc_info[1]), "foo")
+
+
+class ModuleTest(UnitCase):
+
+    def test_make_log_handler__cached(self):
+        with patch.dict(HANDLER_CACHE_NAME, clear=True), \
+                patch("sys.stderr", new=io.StringIO()):
+            handler = make_log_handler(logging.INFO)
+            self.assertIs(make_log_handler(logging.INFO), handler)
+            self.assertIsNot(make_log_handler(logging.DEBUG), handler)
+
+    def test_make_log_handler__not_cached(self):
+        """Check that handlers for streams other than stderr are not cached."""
+        stream = io.StringIO()
+        handler = make_log_handler(logging.INFO, file_=stream)
+        self.assertIsNot(make_log_handler(logging.INFO, file_=stream), handler)
+
+    def test_log_config__nested(self):
+        """Check that exiting a nested block keeps the outer handler."""
+        root = logging.getLogger()
+        with patch.dict(HANDLER_CACHE_NAME, clear=True), \
+                patch("sys.stderr", new=io.StringIO()):
+            outer = log_config(logging.INFO)
+            with outer:
+                inner = log_config(logging.INFO)
+                with inner:
+                    self.assertIsNot(inner.handler, outer.handler)
+                self.assertIn(outer.handler, root.handlers)
+            self.assertNotIn(outer.handler, root.handlers)
+
+    def test_make_log_handler__not_tty(self):
+        """Check that non-terminal streams get uncolored output."""
+        stream = io.StringIO()
+        handler = make_log_handler(logging.INFO, file_=stream)
+        record = logging.LogRecord("a.b", logging.INFO, "", 0, "foo", (), None)
+        handler.handle(record)
+        self.assertEqual(stream.getvalue(), "log: a.b: [INFO] foo\n")
+
+
+class DisplayNameFilterTest(UnitCase):
+
+    def check_filter(self, filter_, cases):
+        for name, expected in cases:
+            with self.subTest(name=name, expected=expected):
+                record = logging.LogRecord(name, logging.INFO, "", 0, "", (), None)
+                self.assertTrue(filter_.filter(record))
+                self.assertEqual(record.display_name, expected)
+
+    def test_filter(self):
+        filter_ = DisplayNameFilter()
+        cases = [
+            ("a", "a"),
+            ("a.b.c.d", "a.b.c.d"),
+        ]
+        self.check_filter(filter_, cases)
+
+    def test_filter__truncate(self):
+        filter_ = DisplayNameFilter(truncate=True)
+        cases = [
+            ("a", "a"),
+            ("a.b.c", "a.b.c"),
+            ("a.b.c.d", "a.b...d"),
+            ("a.b.c.d.e", "a.b...e"),
+        ]
+        self.check_filter(filter_, cases)
@@ -1,4 +1,5 @@
 
+import io
 from textwrap import dedent
 import unittest
 
@@ -15,15 +16,17 @@ class ModuleTest(UnitCase):
         # This test case simultaneously checks all of (1) "compressing" (by
         # weight), (2) lexicographically ordering by choice (and not
         # by weight), and (3) ballots with no choices (aka undervotes).
-        lines = dedent("""\
+        # We pass a file-like object to check that the lines can be
+        # consumed incrementally.
+        f = io.StringIO(dedent("""\
             1 2
             1
             1 3
             2
             4 1
             1 2
-            """).splitlines(keepends=True)
-        normalized = normalized_ballots(lines)
+            """))
+        normalized = normalized_ballots(f)
         # Check that it returns a generator iterator and not a concrete
         # list/tuple/etc.
         self.assertEqual(type(normalized), type((x for x in ())))
@@ -40,47 +43,58 @@ class ModuleTest(UnitCase):
         self.assertEqual(type(result), RoundResults)
         self.assertEqual(result.totals, {1: 3, 2: 2, 4: 0})
 
-    def test_get_majority(self):
-        cases = [
-            (0, 1),
-            (1, 1),
-            (2, 2),
-            (3, 2),
-            (4, 3),
-            (100, 51),
-        ]
-        for total, expected in cases:
-            with self.subTest(total=total, expected=expected):
-                self.assertEqual(get_majority(total), expected)
-
-    def test_get_winner(self):
+    def test_get_winner__tie(self):
         self.assertIs(get_winner({1: 5, 2: 5}), None)
-        cases = [
-            ({1: 6, 2: 5}, 1),
-            ({1: 5, 2: 6}, 2),
-            ({1: 1, 2: 6, 3: 4}, 2),
-        ]
-        for totals, winner in cases:
-            with self.subTest(totals=totals, winner=winner):
-                self.assertEqual(get_winner(totals), winner)
 
     def test_get_lowest__no_totals(self):
         """Test passing an empty totals dict."""
         with self.assertRaises(ValueError):
             get_lowest({})
 
-    def test_get_lowest(self):
-        cases = [
-            ({1: 6, 2: 5}, {2}),
-            ({1: 5, 2: 6}, {1}),
-            ({1: 1, 2: 6, 3: 4}, {1}),
-            # Test ties.
-            ({1: 5, 2: 5}, {1, 2}),
-            ({1: 5, 2: 6, 3: 5}, {1, 3}),
-        ]
-        for totals, lowest in cases:
-            with self.subTest(totals=totals, lowest=lowest):
-                self.assertEqual(get_lowest(totals), lowest)
+
+def add_case_tests(cls, prefix, func, cases):
+    """
+    Add one test method to a test case class for each case.
+
+    Each test method checks that func(arg) equals the expected value,
+    and is named like "test_get_winner_0".
+
+    Arguments:
+      cases: an iterable of (arg, expected) pairs.
+
+    """
+    for i, (arg, expected) in enumerate(cases):
+        def test(self, arg=arg, expected=expected):
+            self.assertEqual(func(arg), expected)
+        setattr(cls, "%s_%d" % (prefix, i), test)
+
+
+add_case_tests(ModuleTest, "test_get_majority", get_majority, [
+    (0, 1),
+    (1, 1),
+    (2, 2),
+    (3, 2),
+    (4, 3),
+    (100, 51),
+])
+
+add_case_tests(ModuleTest, "test_get_winner", get_winner, [
+    ({1: 6, 2: 5}, 1),
+    ({1: 5, 2: 6}, 2),
+    ({1: 1, 2: 6, 3: 4}, 2),
+    # Test a plurality without a majority.
+    ({1: 5, 2: 4, 3: 3}, None),
+    ({}, None),
+])
+
+add_case_tests(ModuleTest, "test_get_lowest", get_lowest, [
+    ({1: 6, 2: 5}, {2}),
+    ({1: 5, 2: 6}, {1}),
+    ({1: 1, 2: 6, 3: 4}, {1}),
+    # Test ties.
+    ({1: 5, 2: 5}, {1, 2}),
+    ({1: 5, 2: 6, 3: 5}, {1, 3}),
+])
 
 
 class InternalBallotsNormalizerTest(UnitCase):
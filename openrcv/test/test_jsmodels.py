@@ -1,5 +1,4 @@
 
-from contextlib import contextmanager
 from textwrap import dedent
 
 from openrcv.jsonlib import JsonObjError, JS_NULL
@@ -9,18 +8,30 @@ from openrcv.utils import StreamInfo, StringInfo
 from openrcv.utiltest.helpers import UnitCase
 
 
-@contextmanager
-def change_attr(obj, name, value):
+# This is a class rather than a @contextmanager generator function to avoid
+# the generator overhead, since it is called repeatedly in test loops.
+class change_attr(object):
+
     """Context manager to temporarily change the value of an attribute.
 
     This is useful for testing __eq__() by modifying one attribute
     at a time.
 
     """
-    initial_value = getattr(obj, name)
-    setattr(obj, name, value)
-    yield
-    setattr(obj, name, initial_value)
+
+    __slots__ = ('obj', 'name', 'value', 'initial_value')
+
+    def __init__(self, obj, name, value):
+        self.obj = obj
+        self.name = name
+        self.value = value
+
+    def __enter__(self):
+        self.initial_value = getattr(self.obj, self.name)
+        setattr(self.obj, self.name, self.value)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        setattr(self.obj, self.name, self.initial_value)
 
 
 class JsonBallotTest(UnitCase):
@@ -38,6 +49,11 @@ class JsonBallotTest(UnitCase):
         self.assertEqual(ballot.choices, ())
         self.assertEqual(ballot.weight, 1)
 
+    def test_init__no_dict(self):
+        """Check that __slots__ prevents an instance __dict__."""
+        ballot = self.make_ballot()
+        self.assertFalse(hasattr(ballot, "__dict__"))
+
     def test_init__tuple(self):
         """Check that JsonBallot converts lists to tuples."""
         ballot = JsonBallot(choices=[])
@@ -107,6 +123,12 @@ class JsonBallotTest(UnitCase):
         ballot.load_jsobj("2 3 4")
         self.assertEqual(ballot, JsonBallot(choices=(3, 4), weight=2))
 
+    def test_load_jsobj__undervote(self):
+        """Check that loading an undervote clears existing choices."""
+        ballot = JsonBallot(choices=(1, 2), weight=3)
+        ballot.load_jsobj("2")
+        self.assertEqual(ballot, JsonBallot(weight=2))
+
     def test_load_jsobj__bad_format(self):
         """Check a string that does not parse."""
         ballot = JsonBallot()
@@ -130,6 +152,20 @@ class JsonBallotTest(UnitCase):
                     JsonBallot(weight=3, choices=(1, 2))]
         self.assertEqual(ballots, expected)
 
+    def test_from_ballot_stream__duplicates(self):
+        """Check that identical lines do not share a ballot object."""
+        ballot_stream = StringInfo(dedent("""\
+        3 1 2
+        2
+        3 1 2
+        """))
+        ballots = JsonBallot.from_ballot_stream(ballot_stream)
+        expected = [JsonBallot(weight=3, choices=(1, 2)),
+                    JsonBallot(weight=2),
+                    JsonBallot(weight=3, choices=(1, 2))]
+        self.assertEqual(ballots, expected)
+        self.assertIsNot(ballots[0], ballots[2])
+
 
 class JsonContestTest(UnitCase):
 
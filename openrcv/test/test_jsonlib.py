@@ -22,6 +22,12 @@ class JsonSample(JsonableMixin):
         return "bar=%r foo=%r" % (self.bar, self.foo)
 
 
+class SubJsonSample(JsonSample):
+
+    data_attrs = JsonSample.data_attrs + (Attribute('baz'), )
+    attrs = data_attrs
+
+
 class ComplexJsonSample(JsonableMixin):
 
     data_attrs = (Attribute('simple', JsonSample), )
@@ -79,3 +85,8 @@ class JsonableMixinTest(UnitCase):
         self.assertNotEqual(sample1, sample2)
         sample1.foo = "abc"
         self.assertEqual(sample1, sample2)
+
+    def test_get_attr_names(self):
+        self.assertEqual(JsonSample.get_attr_names(), {'bar', 'foo'})
+        # Check that a subclass does not reuse its parent's cached value.
+        self.assertEqual(SubJsonSample.get_attr_names(), {'bar', 'baz', 'foo'})
@@ -22,6 +22,10 @@ class ModuleTest(UnitCase):
         with self.assertRaises(ValueError):
             parse_internal_ballot("f 2 \n")
 
+    def test_parse_internal_ballot__empty(self):
+        with self.assertRaises(ValueError):
+            parse_internal_ballot(" \n")
+
 
 class ReprMixinTest(UnitCase):
 
@@ -59,6 +63,17 @@ class StringInfoTest(UnitCase):
         # The value is also still available as an attribute.
         self.assertEqual(stream.value, "abc")
 
+    def test_open__read__none(self):
+        """Test reading a StringInfo whose value is None."""
+        stream = StringInfo()
+        with stream.open() as f:
+            out = f.read()
+        self.assertEqual(out, "")
+        # Closing the stream sets the value to the empty string.
+        self.assertEqual(stream.value, "")
+        with self.assertRaises(ValueError):
+            stream.open("w")
+
     def test_open__write(self):
         stream = StringInfo()
         with stream.open("w") as f:
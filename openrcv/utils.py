@@ -111,10 +111,15 @@ def time_it(description):
 
 class ReprMixin(object):
 
+    # An empty __slots__ lets subclasses that define __slots__ avoid
+    # having an instance __dict__.
+    __slots__ = ()
+
     # TODO: look up the proper return type.
     def __repr__(self):
         desc = self.repr_desc() or "--"
-        return "<%s: [%s] %s>" % (self.__class__.__name__, desc, hex(id(self)))
+        # "0x%x" gives the same result as hex() without an extra string.
+        return "<%s: [%s] 0x%x>" % (type(self).__name__, desc, id(self))
 
     def repr_desc(self):
         return None
@@ -208,4 +213,9 @@ class StringInfo(StreamInfo):
         if (value is not None and mode != "r"):
             raise ValueError("Cannot write to string that already has a value: %r" % display)
         log.info("opening in-memory text stream (mode=%r): contents=%r" % (mode, display))
-        return _EjectingStringIO(self.value, self)
+        if mode == "r" and value is not None:
+            # Reading cannot change the value, so there is no need to copy
+            # the buffer back into self.value when closing.  We exclude a
+            # None value because closing the stream sets it to "".
+            return io.StringIO(value)
+        return _EjectingStringIO(value, self)
@@ -1,5 +1,4 @@
 
-import glob
 import logging
 import os
 from pathlib import Path
@@ -86,7 +85,8 @@ def build_html():
     target_readme_path = md2html(README_PATH)
 
     ensure_dir(html_target_path(DOCS_PATH))
-    md_paths = glob.glob(os.path.join(DOCS_PATH, "*.md"))
+    md_paths = [os.path.join(DOCS_PATH, name) for name in os.listdir(DOCS_PATH)
+                if name.endswith(".md") and not name.startswith(".")]
     for md_path in md_paths:
         md2html(md_path)
 